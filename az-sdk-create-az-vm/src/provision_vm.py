@@ -75,8 +75,11 @@ print(
 # Obtain the management object for networks
 network_client = NetworkManagementClient(credential, subscription_id)
 
-# Step 2: provision a virtual network and wait for completion
-poller = network_client.virtual_networks.begin_create_or_update(
+# Step 2: start provisioning the virtual network, the public IP address and the
+# network security group. These resources depend only on the resource group, so
+# the three operations run in parallel; each poller is waited on when its result
+# is needed.
+vnet_poller = network_client.virtual_networks.begin_create_or_update(
     RESOURCE_GROUP_NAME,
     VNET_NAME,
     {
@@ -85,7 +88,56 @@ poller = network_client.virtual_networks.begin_create_or_update(
     },
 )
 
-vnet_result = poller.result()
+ip_address_poller = network_client.public_ip_addresses.begin_create_or_update(
+    RESOURCE_GROUP_NAME,
+    IP_NAME,
+    {
+        "location": LOCATION,
+        "sku": {"name": "Standard"},
+        "public_ip_allocation_method": "Static",
+        "public_ip_address_version": "IPV4",
+    },
+)
+
+nsg_poller = network_client.network_security_groups.begin_create_or_update(
+    RESOURCE_GROUP_NAME,
+    NETWORK_SECURITY_GROUP,
+    {
+        "location": LOCATION,
+         "securityRules": [
+          {
+            "name": "SSH-rule",
+            "properties": {
+              "description": "allow SSH",
+              "protocol": "Tcp",
+              "sourcePortRange": "*",
+              "destinationPortRange": "22",
+              "sourceAddressPrefix": "*",
+              "destinationAddressPrefix": "VirtualNetwork",
+              "access": "Allow",
+              "priority": 200,
+              "direction": "Inbound"
+            }
+          },
+          {
+            "name": "RDP-rule",
+            "properties": {
+              "description": "allow RDP",
+              "protocol": "Tcp",
+              "sourcePortRange": "*",
+              "destinationPortRange": "3389",
+              "sourceAddressPrefix": "*",
+              "destinationAddressPrefix": "VirtualNetwork",
+              "access": "Allow",
+              "priority": 300,
+              "direction": "Inbound"
+            }
+          }
+        ]
+    }
+)
+
+vnet_result = vnet_poller.result()
 
 now = datetime.now().strftime("%H:%M:%S")
 print(
@@ -93,12 +145,24 @@ print(
 prefixes: {vnet_result.address_space.address_prefixes}"
 )
 
-# Step 3: Provision the subnet and wait for completion
+# Step 3: Wait for completion of the network security group
+nsg_result = nsg_poller.result()
+
+now = datetime.now().strftime("%H:%M:%S")
+print(f"{now} - Provisioned network security group: {nsg_result.name}")
+
+# Step 4: Provision the subnet, associated with the network security group, and
+# wait for completion
 poller = network_client.subnets.begin_create_or_update(
     RESOURCE_GROUP_NAME,
     VNET_NAME,
     SUBNET_NAME,
-    {"address_prefix": "10.0.0.0/24"},
+    {
+        "address_prefix": "10.0.0.0/24",
+        "networkSecurityGroup": {
+            "id": nsg_result.id
+        }
+    }
 )
 subnet_result = poller.result()
 
@@ -108,19 +172,8 @@ print(
 prefix: {subnet_result.address_prefix}"
 )
 
-# Step 4: Provision a public IP address and wait for completion
-poller = network_client.public_ip_addresses.begin_create_or_update(
-    RESOURCE_GROUP_NAME,
-    IP_NAME,
-    {
-        "location": LOCATION,
-        "sku": {"name": "Standard"},
-        "public_ip_allocation_method": "Static",
-        "public_ip_address_version": "IPV4",
-    },
-)
-
-ip_address_result = poller.result()
+# Step 5: Wait for completion of the public IP address
+ip_address_result = ip_address_poller.result()
 
 now = datetime.now().strftime("%H:%M:%S")
 print(
@@ -128,7 +181,7 @@ print(
 with address {ip_address_result.ip_address}"
 )
 
-# Step 5: Provision the network interface client
+# Step 6: Provision the network interface client
 poller = network_client.network_interfaces.begin_create_or_update(
     RESOURCE_GROUP_NAME,
     NIC_NAME,
@@ -159,7 +212,7 @@ print(
 take a few minutes."
 )
 
-# Step 6: Provision the virtual machine
+# Step 7: Provision the virtual machine
 poller = compute_client.virtual_machines.begin_create_or_update(
     RESOURCE_GROUP_NAME,
     VM_NAME,
@@ -193,66 +246,3 @@ vm_result = poller.result()
 
 now = datetime.now().strftime("%H:%M:%S")
 print(f"{now} - Provisioned virtual machine: {vm_result.name}")
-
-
-# Step 7: Provision the network security group
-print( f"{now} - Provisioning network security group: {NETWORK_SECURITY_GROUP}" )
-
-poller = network_client.network_security_groups.begin_create_or_update( 
-    RESOURCE_GROUP_NAME,
-    NETWORK_SECURITY_GROUP,
-    {
-        "location": LOCATION,
-         "securityRules": [
-          {
-            "name": "SSH-rule",
-            "properties": {
-              "description": "allow SSH",
-              "protocol": "Tcp",
-              "sourcePortRange": "*",
-              "destinationPortRange": "22",
-              "sourceAddressPrefix": "*",
-              "destinationAddressPrefix": "VirtualNetwork",
-              "access": "Allow",
-              "priority": 200,
-              "direction": "Inbound"
-            }
-          },
-          {
-            "name": "RDP-rule",
-            "properties": {
-              "description": "allow RDP",
-              "protocol": "Tcp",
-              "sourcePortRange": "*",
-              "destinationPortRange": "3389",
-              "sourceAddressPrefix": "*",
-              "destinationAddressPrefix": "VirtualNetwork",
-              "access": "Allow",
-              "priority": 300,
-              "direction": "Inbound"
-            }
-          }
-        ]
-    }
-)
-
-nsg_result = poller.result()
-
-now = datetime.now().strftime("%H:%M:%S")
-print(f"{now} - Provisioned network security group: {nsg_result.name}")
-
-poller = network_client.subnets.begin_create_or_update(
-    RESOURCE_GROUP_NAME,
-    VNET_NAME,
-    SUBNET_NAME,
-    {
-        "address_prefix": "10.0.0.0/24",
-        "networkSecurityGroup": {
-            "id": nsg_result.id
-        }
-    }
-)
-subnet_result = poller.result()
-
-now = datetime.now().strftime("%H:%M:%S")
-print(f"{now} - added nsg to the subnet: {subnet_result.name}")
\ No newline at end of file